@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from time import perf_counter
 
+from ipa_whisper_assessor.cli import configure_warnings
 from ipa_whisper_assessor.transcribe import TranscribeOptions, transcribe_audio
 
 
+def _init_worker() -> None:
+    # One intra-op thread per process; parallelism comes from the pool.
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    configure_warnings()
+
+
+def _one(path: Path, device: str) -> tuple[str, int]:
+    res = transcribe_audio(str(path), TranscribeOptions(device=device))  # type: ignore[arg-type]
+    return path.name, len(res.ipa_text)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("folder")
     ap.add_argument("--device", default="auto")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores with --device cpu, otherwise 1).",
+    )
     args = ap.parse_args()
 
     folder = Path(args.folder)
@@ -19,15 +40,22 @@ def main() -> int:
         print("No audio files found.")
         return 1
 
+    workers = args.workers or ((os.cpu_count() or 1) if args.device == "cpu" else 1)
+    one = partial(_one, device=args.device)
+
     t0 = perf_counter()
-    for p in files:
-        res = transcribe_audio(str(p), TranscribeOptions(device=args.device))
-        print(p.name, len(res.ipa_text))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+            results = list(ex.map(one, files))
+    else:
+        configure_warnings()
+        results = [one(p) for p in files]
+    for name, n_chars in results:
+        print(name, n_chars)
     dt = perf_counter() - t0
-    print(f"Processed {len(files)} files in {dt:.2f}s")
+    print(f"Processed {len(files)} files in {dt:.2f}s ({workers} worker(s))")
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -24,6 +24,7 @@ def main() -> int:
         reference=ref,
         g2p=args.g2p,
         lexicon=None,
+        transcription_json=None,
         out_json=str(out_dir / f"{stem}.json"),
         out_html=str(out_dir / f"{stem}.html"),
         timestamps="word",
@@ -1,14 +1,47 @@
 from __future__ import annotations
 
+import functools
+import itertools
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
-from .edit_distance import EditOp, edit_counts, levenshtein_ops
+from .edit_distance import EditOp, levenshtein_distance, levenshtein_ops
 from .ipa_tokenize import tokenize_ipa
 
+# Both accelerated paths below work on numpy arrays; each is used only if its library imports.
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    np = None
 
-@dataclass(frozen=True)
-class PredWord:
+try:
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein  # type: ignore[import-not-found]
+    from rapidfuzz.process import cdist as _rf_cdist  # type: ignore[import-not-found]
+
+    _HAS_RAPIDFUZZ = np is not None
+except ImportError:  # pragma: no cover
+    _HAS_RAPIDFUZZ = False
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+
+    _HAS_NUMBA = np is not None
+except ImportError:  # pragma: no cover
+    _HAS_NUMBA = False
+
+# A word substitution costing more than deleting + inserting the word (2) can never win a
+# cell, so word costs are computed with this cutoff (anything above reads as 3).
+_MAX_WORD_COST = 2
+
+# Word-level traceback codes (one byte per DP cell); ties prefer match > del > ins.
+MATCH_WORD = 0
+DEL_WORD = 1
+INS_WORD = 2
+
+
+class PredWord(NamedTuple):
     ipa: str
     start: Optional[float] = None
     end: Optional[float] = None
@@ -25,12 +58,100 @@ class AlignedWord:
     phoneme_ops: list[EditOp]
 
 
-def _word_cost(expected_ipa: str, predicted_ipa: str) -> int:
-    e = tokenize_ipa(expected_ipa)
-    p = tokenize_ipa(predicted_ipa)
-    ops = levenshtein_ops(e, p)
-    subs, ins, dels = edit_counts(ops)
-    return subs + ins + dels
+def _word_costs(exp_toks: list[Sequence[str]], pred_toks: list[Sequence[str]]):
+    """
+    n x m matrix of phoneme edit distances between expected and predicted words.
+    """
+    if _HAS_RAPIDFUZZ and exp_toks and pred_toks:
+        return _rf_cdist(
+            exp_toks,
+            pred_toks,
+            scorer=_RFLevenshtein.distance,
+            dtype=np.int32,
+            score_cutoff=_MAX_WORD_COST,
+        )
+    return [[levenshtein_distance(e, p, _MAX_WORD_COST) for p in pred_toks] for e in exp_toks]
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _word_dp(costs):  # pragma: no cover - compiled
+        n, m = costs.shape
+        width = m + 1
+        dp = np.zeros((n + 1) * width, dtype=np.int32)
+        back = np.zeros((n + 1) * width, dtype=np.uint8)
+        for j in range(1, width):
+            dp[j] = j
+            back[j] = INS_WORD
+        for i in range(1, n + 1):
+            row = i * width
+            dp[row] = i
+            back[row] = DEL_WORD
+            for j in range(1, width):
+                sub = dp[row - width + j - 1] + costs[i - 1, j - 1]
+                dele = dp[row - width + j] + 1
+                ins = dp[row + j - 1] + 1
+                if sub <= dele and sub <= ins:
+                    dp[row + j] = sub
+                    back[row + j] = MATCH_WORD
+                elif dele <= ins:
+                    dp[row + j] = dele
+                    back[row + j] = DEL_WORD
+                else:
+                    dp[row + j] = ins
+                    back[row + j] = INS_WORD
+        return dp[(n + 1) * width - 1], back
+
+
+@functools.lru_cache(maxsize=65_536)
+def _word_ops(expected: tuple[str, ...], predicted: tuple[str, ...]) -> tuple[EditOp, ...]:
+    """
+    Phoneme edit script for one word pair; memoized since the same (word, pronunciation)
+    pairs recur within an utterance and across a batch.
+    """
+    return tuple(levenshtein_ops(expected, predicted))
+
+
+def _word_back(costs, n: int, m: int) -> bytes | bytearray:
+    """
+    Run the word-level DP and return the flat (n+1)*(m+1) traceback.
+    """
+    if _HAS_NUMBA:
+        _, back_arr = _word_dp(np.asarray(costs, dtype=np.int32).reshape(n, m))
+        return back_arr.tobytes()
+    if not isinstance(costs, list):
+        costs = costs.tolist()
+
+    width = m + 1
+    dp = array("i", [0]) * (width * (n + 1))
+    back = bytearray(width * (n + 1))
+
+    for i in range(1, n + 1):
+        dp[i * width] = i
+        back[i * width] = DEL_WORD
+    for j in range(1, width):
+        dp[j] = j
+        back[j] = INS_WORD
+
+    for i in range(1, n + 1):
+        row_costs = costs[i - 1]
+        row = i * width
+        up = row - width
+        for j in range(1, width):
+            sub = dp[up + j - 1] + row_costs[j - 1]
+            dele = dp[up + j] + 1
+            ins = dp[row + j - 1] + 1
+            if sub <= dele and sub <= ins:
+                dp[row + j] = sub
+                back[row + j] = MATCH_WORD
+            elif dele <= ins:
+                dp[row + j] = dele
+                back[row + j] = DEL_WORD
+            else:
+                dp[row + j] = ins
+                back[row + j] = INS_WORD
+    return back
 
 
 def align_words(
@@ -46,39 +167,22 @@ def align_words(
     if len(expected_ipa_words) != n:
         raise ValueError("expected_ipa_words must match reference_words length")
 
-    dp = [[0] * (m + 1) for _ in range(n + 1)]
-    back = [[""] * (m + 1) for _ in range(n + 1)]
-
-    for i in range(1, n + 1):
-        dp[i][0] = i
-        back[i][0] = "del_word"
-    for j in range(1, m + 1):
-        dp[0][j] = j
-        back[0][j] = "ins_word"
+    # Tokenize each word once; the DP only needs the n x m cost matrix, and edit scripts
+    # are computed during the backtrace for the cells actually visited.
+    exp_toks = [tokenize_ipa(e) for e in expected_ipa_words]
+    pred_toks = [tokenize_ipa(p.ipa) for p in predicted_words]
 
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            cost_sub = _word_cost(expected_ipa_words[i - 1], predicted_words[j - 1].ipa)
-            sub = dp[i - 1][j - 1] + cost_sub
-            dele = dp[i - 1][j] + 1
-            ins = dp[i][j - 1] + 1
-            best = min(sub, dele, ins)
-            dp[i][j] = best
-            if best == sub:
-                back[i][j] = "match_word"
-            elif best == dele:
-                back[i][j] = "del_word"
-            else:
-                back[i][j] = "ins_word"
+    back = _word_back(_word_costs(exp_toks, pred_toks), n, m)
+    width = m + 1
 
     aligned: list[AlignedWord] = []
     i, j = n, m
     while i > 0 or j > 0:
-        step = back[i][j]
-        if step == "match_word":
+        step = back[i * width + j]
+        if step == MATCH_WORD:
             exp = expected_ipa_words[i - 1]
             pred = predicted_words[j - 1]
-            ops = levenshtein_ops(tokenize_ipa(exp), tokenize_ipa(pred.ipa))
+            ops = list(_word_ops(exp_toks[i - 1], pred_toks[j - 1]))
             aligned.append(
                 AlignedWord(
                     index=i - 1,
@@ -92,9 +196,9 @@ def align_words(
             )
             i -= 1
             j -= 1
-        elif step == "del_word":
+        elif step == DEL_WORD:
             exp = expected_ipa_words[i - 1]
-            ops = levenshtein_ops(tokenize_ipa(exp), [])
+            ops = list(_word_ops(exp_toks[i - 1], ()))
             aligned.append(
                 AlignedWord(
                     index=i - 1,
@@ -110,7 +214,7 @@ def align_words(
         else:
             # Insertion word: ignore it at the word table level (still impacts overall PER via ops)
             pred = predicted_words[j - 1]
-            ops = levenshtein_ops([], tokenize_ipa(pred.ipa))
+            ops = list(_word_ops((), pred_toks[j - 1]))
             aligned.append(
                 AlignedWord(
                     index=-1,
@@ -130,8 +234,5 @@ def align_words(
 
 
 def compute_overall_ops(aligned_words: list[AlignedWord]) -> list[EditOp]:
-    ops: list[EditOp] = []
-    for w in aligned_words:
-        ops.extend(w.phoneme_ops)
-    return ops
+    return list(itertools.chain.from_iterable(w.phoneme_ops for w in aligned_words))
 
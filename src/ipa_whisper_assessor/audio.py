@@ -6,19 +6,19 @@ from pathlib import Path
 
 import numpy as np
 
+SAMPLE_RATE = 16000
+
 
 def ffmpeg_available() -> bool:
     return shutil.which("ffmpeg") is not None
 
 
-def load_audio_16k_mono_ffmpeg(path: str | Path) -> tuple[np.ndarray, int]:
-    """
-    Decode audio with ffmpeg into float32 PCM, 16kHz, mono.
+def _ffmpeg_pcm(path: str, fmt: str, dtype: type) -> np.ndarray:
     """
-    if not ffmpeg_available():
-        raise RuntimeError("ffmpeg not found on PATH. Install ffmpeg or use a supported WAV input.")
+    Run ffmpeg and stream its raw PCM output straight into a numpy buffer.
 
-    path = str(path)
+    The buffer starts at 30s of audio and doubles as needed, then is shrunk in place at EOF.
+    """
     cmd = [
         "ffmpeg",
         "-nostdin",
@@ -29,12 +29,129 @@ def load_audio_16k_mono_ffmpeg(path: str | Path) -> tuple[np.ndarray, int]:
         "-ac",
         "1",
         "-ar",
-        "16000",
+        str(SAMPLE_RATE),
         "-f",
-        "f32le",
+        fmt,
         "pipe:1",
     ]
-    proc = subprocess.run(cmd, check=True, stdout=subprocess.PIPE)
-    audio = np.frombuffer(proc.stdout, dtype=np.float32)
-    return audio, 16000
+    buf = np.empty(SAMPLE_RATE * 30, dtype=dtype)
+    filled = 0  # bytes
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=0) as proc:
+        assert proc.stdout is not None
+        while True:
+            if filled == buf.nbytes:
+                grown = np.empty(buf.size * 2, dtype=dtype)
+                grown.view(np.uint8)[:filled] = buf.view(np.uint8)
+                buf = grown
+            with memoryview(buf.view(np.uint8)) as view:
+                n = proc.stdout.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    buf.resize(filled // buf.itemsize, refcheck=False)
+    return buf
+
 
+def load_audio_16k_mono_ffmpeg(path: str | Path) -> tuple[np.ndarray, int]:
+    """
+    Decode audio with ffmpeg into float32 PCM, 16kHz, mono.
+    """
+    if not ffmpeg_available():
+        raise RuntimeError("ffmpeg not found on PATH. Install ffmpeg or use a supported WAV input.")
+
+    return _ffmpeg_pcm(str(path), "f32le", np.float32), SAMPLE_RATE
+
+
+def load_audio_16k_mono_int16(path: str | Path) -> tuple[np.ndarray, int]:
+    """
+    Decode audio with ffmpeg into int16 PCM, 16kHz, mono (half the bytes of float32).
+
+    Opt-in for callers that want the smaller transfer; deeper sources are quantized to 16 bits.
+    """
+    if not ffmpeg_available():
+        raise RuntimeError("ffmpeg not found on PATH. Install ffmpeg or use a supported WAV input.")
+
+    return _ffmpeg_pcm(str(path), "s16le", np.int16), SAMPLE_RATE
+
+
+def pcm16_to_float32(pcm: np.ndarray) -> np.ndarray:
+    return np.multiply(pcm, 1.0 / 32768.0, dtype=np.float32)
+
+
+class _DecodeError(Exception):
+    """An in-process decoder is not installed or cannot read the input."""
+
+
+def _load_soundfile(path: str) -> np.ndarray:
+    try:
+        import soundfile as sf  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise _DecodeError("soundfile is not installed") from e
+
+    try:
+        audio, sr = sf.read(path, dtype="float32", always_2d=False)
+    except (sf.LibsndfileError, RuntimeError, ValueError) as e:
+        raise _DecodeError(str(e)) from e
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    if sr != SAMPLE_RATE:
+        try:
+            import soxr  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise _DecodeError("soxr is not installed (needed to resample)") from e
+
+        audio = soxr.resample(audio, sr, SAMPLE_RATE).astype(np.float32, copy=False)
+    return audio
+
+
+def _load_av(path: str) -> np.ndarray:
+    try:
+        import av  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise _DecodeError("PyAV is not installed") from e
+
+    chunks: list[np.ndarray] = []
+    try:
+        with av.open(path) as container:
+            if not container.streams.audio:
+                raise _DecodeError(f"no audio stream in {path}")
+            stream = container.streams.audio[0]
+            resampler = av.AudioResampler(format="flt", layout="mono", rate=SAMPLE_RATE)
+            for frame in container.decode(stream):
+                for out in resampler.resample(frame):
+                    chunks.append(out.to_ndarray().reshape(-1))
+            for out in resampler.resample(None):  # flush
+                chunks.append(out.to_ndarray().reshape(-1))
+    except (av.FFmpegError, RuntimeError, ValueError) as e:
+        raise _DecodeError(str(e)) from e
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def load_audio_16k_mono(path: str | Path) -> tuple[np.ndarray, int]:
+    """
+    Decode audio in-process into float32 PCM, 16kHz, mono.
+
+    Tries soundfile (libsndfile, + soxr to resample), then PyAV; falls back to an ffmpeg
+    subprocess when neither is installed or the format is unsupported. The ffmpeg fallback
+    pipes float32 so 24-bit and float sources keep their precision. URLs and other non-file
+    inputs go straight to ffmpeg.
+    """
+    path = str(path)
+    if "://" not in path:
+        if not Path(path).exists():
+            raise FileNotFoundError(path)
+        last_error: Exception | None = None
+        for loader in (_load_soundfile, _load_av):
+            try:
+                return loader(path), SAMPLE_RATE
+            except _DecodeError as e:
+                last_error = e
+        if not ffmpeg_available() and last_error is not None:
+            raise RuntimeError(
+                f"Could not decode {path} in-process, and ffmpeg (the fallback) is not on PATH."
+            ) from last_error
+    return load_audio_16k_mono_ffmpeg(path)
@@ -1,27 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 
-from .align import AlignedWord, PredWord, align_words
-from .edit_distance import edit_counts, levenshtein_ops
-from .g2p import G2POptions, g2p_words
-from .audio import ffmpeg_available
-from .ipa_tokenize import split_reference_words
-from .ipa_tokenize import tokenize_ipa
-from .report import write_html, write_json
-from .schemas import (
-    AssessmentMetrics,
-    AssessmentResult,
-    MistakeEvent,
-    PhonemeOp,
-    TranscriptionResult,
-    WordAlignment,
-)
-from .score import apply_default_mistake_rules, substitution_histogram
-from .transcribe import MODEL_ID, TranscribeOptions, transcribe_audio
+# Keep module import cheap (`--help`, `doctor`): heavier modules (pydantic schemas, numba/
+# rapidfuzz alignment, G2P, torch via transcription) are imported inside the commands.
+from .transcribe import MODEL_ID
 
 
 app = typer.Typer(
@@ -31,7 +17,7 @@ app = typer.Typer(
 )
 
 
-def _configure_warnings() -> None:
+def configure_warnings() -> None:
     """
     Suppress known noisy warnings (set `IPA_ASSESS_SHOW_WARNINGS=1` to keep them).
     """
@@ -76,10 +62,13 @@ def doctor() -> None:
     """
     Print a quick environment diagnostic (useful for macOS/MPS setup).
     """
+    import importlib.util
     import platform
     import shutil
     import sys
 
+    from .audio import ffmpeg_available
+
     typer.echo(f"python: {sys.version.split()[0]}")
     typer.echo(f"platform: {platform.platform()}")
     typer.echo(f"ffmpeg: {'yes' if ffmpeg_available() else 'no'}")
@@ -118,6 +107,22 @@ def doctor() -> None:
     except Exception:
         typer.echo("pronouncing: not installed (optional, for --g2p cmudict)")
 
+    from .g2p import _cache_disabled, _g2p_cache_dir, _g2p_cache_settings
+
+    if importlib.util.find_spec("diskcache") is None:
+        typer.echo("g2p cache: off (install diskcache to enable)")
+    elif _cache_disabled():
+        typer.echo("g2p cache: off (IPA_ASSESS_NO_CACHE is set)")
+    elif (settings := _g2p_cache_settings()) is None:
+        typer.echo(f"g2p cache: {_g2p_cache_dir()} (not created yet)")
+    else:
+        typer.echo(f"g2p cache: {_g2p_cache_dir()} ({settings.get('count', 0)} words)")
+        if settings.get("statistics"):
+            hits, misses = settings.get("hits", 0), settings.get("misses", 0)
+            typer.echo(f"g2p cache hits/misses: {hits}/{misses}")
+        else:
+            typer.echo("g2p cache hits/misses: not recorded (set IPA_ASSESS_CACHE_STATS=1)")
+
 
 @app.command()
 def transcribe(
@@ -129,7 +134,9 @@ def transcribe(
     chunk_length: int = typer.Option(30, "--chunk-length", help="Chunk length in seconds (long-form)."),
     model: str = typer.Option(MODEL_ID, "--model", help="HF model id."),
 ) -> None:
-    _configure_warnings()
+    from .transcribe import TranscribeOptions, transcribe_audio
+
+    configure_warnings()
     ts = None
     if timestamps:
         if timestamps not in {"word", "chunk"}:
@@ -168,7 +175,58 @@ def assess(
     model: str = typer.Option(MODEL_ID, "--model", help="HF model id."),
     espeak_language: str = typer.Option("en-us", "--espeak-language", help="eSpeak language (espeak backend)."),
 ) -> None:
-    _configure_warnings()
+    _assess(
+        audio=audio,
+        reference=reference,
+        g2p=g2p,
+        lexicon=lexicon,
+        transcription_json=transcription_json,
+        out_json=out_json,
+        out_html=out_html,
+        timestamps=timestamps,
+        device=device,
+        chunk_length=chunk_length,
+        model=model,
+        espeak_language=espeak_language,
+    )
+
+
+def _assess(
+    *,
+    audio: str,
+    reference: str,
+    g2p: str,
+    lexicon: str | None,
+    transcription_json: str | None,
+    out_json: str,
+    out_html: str | None,
+    timestamps: str,
+    device: str,
+    chunk_length: int,
+    model: str,
+    espeak_language: str,
+    pipe: Any = None,
+) -> None:
+    """
+    Implementation of `assess`; `pipe` lets callers (e.g. `batch`) reuse a loaded pipeline.
+    """
+    from .align import AlignedWord, PredWord, align_words, compute_overall_ops
+    from .edit_distance import levenshtein_ops
+    from .g2p import G2POptions, g2p_words
+    from .ipa_tokenize import split_reference_words, tokenize_ipa
+    from .report import write_html, write_json
+    from .schemas import (
+        AssessmentMetrics,
+        AssessmentResult,
+        MistakeEvent,
+        PhonemeOp,
+        TranscriptionResult,
+        WordAlignment,
+    )
+    from .score import summarize
+    from .transcribe import TranscribeOptions, transcribe_audio
+
+    configure_warnings()
     if timestamps not in {"word", "chunk"}:
         raise typer.BadParameter("--timestamps must be 'word' or 'chunk'")
     if g2p not in {"espeak", "cmudict"}:
@@ -183,7 +241,7 @@ def assess(
         t_opts = TranscribeOptions(
             model=model, device=device, chunk_length_s=chunk_length, timestamps=timestamps  # type: ignore[arg-type]
         )
-        transcription = transcribe_audio(audio, t_opts)
+        transcription = transcribe_audio(audio, t_opts, pipe=pipe)
 
     # 2) Build predicted word list
     pred_words = [
@@ -222,17 +280,16 @@ def assess(
         aligned = align_words(ref_words, expected_ipa_words, pred_words)
 
     # 5) Metrics + summaries
-    all_ops = []
-    for w in aligned:
-        all_ops.extend(w.phoneme_ops)
+    all_ops = compute_overall_ops(aligned)
 
-    subs, ins, dels = edit_counts(all_ops)
-    denom = max(1, sum(1 for o in all_ops if o.expected is not None))
+    hist, mistake_counts, subs, ins, dels = summarize(all_ops)
+    # Every op except an insertion consumes one expected phoneme.
+    denom = max(1, len(all_ops) - ins)
     per = (subs + ins + dels) / denom
 
     mistakes = [
         MistakeEvent(rule=rule, expected=e, predicted=p, count=n)
-        for (rule, e, p, n) in apply_default_mistake_rules(all_ops)
+        for (rule, e, p, n) in mistake_counts
     ]
 
     result = AssessmentResult(
@@ -249,8 +306,10 @@ def assess(
                 predicted_ipa=w.predicted_ipa,
                 start=w.start,
                 end=w.end,
+                # Ops come from our own DP over interned tokens; no need to re-validate each one.
                 phoneme_ops=[
-                    PhonemeOp(op=o.op, expected=o.expected, predicted=o.predicted) for o in w.phoneme_ops
+                    PhonemeOp.model_construct(op=o.op, expected=o.expected, predicted=o.predicted)
+                    for o in w.phoneme_ops
                 ],
             )
             for w in aligned
@@ -258,7 +317,7 @@ def assess(
         metrics=AssessmentMetrics(
             phoneme_error_rate=per, substitutions=subs, insertions=ins, deletions=dels
         ),
-        substitution_histogram=substitution_histogram(all_ops),
+        substitution_histogram=hist,
         mistakes=mistakes,
     )
 
@@ -281,9 +340,17 @@ def batch(
     g2p: str = typer.Option("espeak", "--g2p", help="espeak|cmudict"),
     device: str = typer.Option("auto", "--device", help="auto|cpu|cuda|mps"),
     model: str = typer.Option(MODEL_ID, "--model", help="HF model id."),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        help="Files to assess concurrently (threads share one model; inference runs one at a time).",
+    ),
 ) -> None:
-    _configure_warnings()
+    configure_warnings()
     import csv
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .transcribe import TranscribeOptions, load_pipeline
 
     folder_p = Path(folder)
     out_p = Path(out_dir)
@@ -295,17 +362,25 @@ def batch(
         for row in reader:
             refs[row["file"]] = row["reference"]
 
-    for audio_path in sorted(folder_p.glob("*")):
-        if audio_path.name not in refs:
-            continue
+    jobs = [p for p in sorted(folder_p.glob("*")) if p.name in refs]
+    if not jobs:
+        return
+
+    # Load the model once for the whole batch.
+    pipe = load_pipeline(
+        TranscribeOptions(model=model, device=device, chunk_length_s=30, timestamps="word")  # type: ignore[arg-type]
+    )
+
+    def _run(audio_path: Path) -> None:
         stem = audio_path.stem
         out_json = out_p / f"{stem}.json"
         out_html = out_p / f"{stem}.html"
-        assess(
+        _assess(
             audio=str(audio_path),
             reference=refs[audio_path.name],
             g2p=g2p,
             lexicon=None,
+            transcription_json=None,
             out_json=str(out_json),
             out_html=str(out_html),
             timestamps="word",
@@ -313,4 +388,13 @@ def batch(
             chunk_length=30,
             model=model,
             espeak_language="en-us",
+            pipe=pipe,
         )
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            # Consume results so worker exceptions propagate.
+            list(ex.map(_run, jobs))
+    else:
+        for audio_path in jobs:
+            _run(audio_path)
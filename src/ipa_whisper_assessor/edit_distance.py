@@ -1,62 +1,194 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, Optional
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from typing import Literal, NamedTuple, Optional
+
+try:
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein  # type: ignore[import-not-found]
+
+    _HAS_RAPIDFUZZ = True
+except ImportError:  # pragma: no cover
+    _HAS_RAPIDFUZZ = False
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+    from numba import njit  # type: ignore[import-not-found]
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    _HAS_NUMBA = False
+
+from .ipa_tokenize import token_ids
 
 
 Op = Literal["match", "sub", "ins", "del"]
 
 
-@dataclass(frozen=True)
-class EditOp:
+class EditOp(NamedTuple):
+    # A plain tuple: the DP backtrace creates one per phoneme, so keep it cheap.
     op: Op
     expected: Optional[str] = None
     predicted: Optional[str] = None
 
 
-def levenshtein_ops(expected: list[str], predicted: list[str]) -> list[EditOp]:
-    """
-    Levenshtein DP that returns a stable edit script (prefers match/sub over indels on ties).
-    """
+# Traceback codes (one byte per DP cell).
+OP_MATCH = 0
+OP_SUB = 1
+OP_DEL = 2
+OP_INS = 3
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _lev_core(a, b):  # pragma: no cover - compiled
+        n = a.shape[0]
+        m = b.shape[0]
+        width = m + 1
+        prev = np.arange(width).astype(np.int32)
+        cur = np.zeros(width, dtype=np.int32)
+        back = np.zeros((n + 1) * width, dtype=np.uint8)
+        for j in range(1, width):
+            back[j] = OP_INS
+        for i in range(1, n + 1):
+            row = i * width
+            cur[0] = i
+            back[row] = OP_DEL
+            for j in range(1, width):
+                if a[i - 1] == b[j - 1]:
+                    sub = prev[j - 1]
+                    code = OP_MATCH
+                else:
+                    sub = prev[j - 1] + 1
+                    code = OP_SUB
+                dele = prev[j] + 1
+                ins = cur[j - 1] + 1
+                if sub <= dele and sub <= ins:
+                    cur[j] = sub
+                elif dele <= ins:
+                    cur[j] = dele
+                    code = OP_DEL
+                else:
+                    cur[j] = ins
+                    code = OP_INS
+                back[row + j] = code
+            prev, cur = cur, prev
+        return prev[m], back
+
+    @njit(cache=True)
+    def _lev_dist_core(a, b, limit):  # pragma: no cover - compiled
+        n = a.shape[0]
+        m = b.shape[0]
+        prev = np.arange(m + 1).astype(np.int32)
+        cur = np.zeros(m + 1, dtype=np.int32)
+        for i in range(1, n + 1):
+            cur[0] = i
+            row_min = i
+            for j in range(1, m + 1):
+                best = min(
+                    prev[j - 1] + (0 if a[i - 1] == b[j - 1] else 1), prev[j] + 1, cur[j - 1] + 1
+                )
+                cur[j] = best
+                row_min = min(row_min, best)
+            if row_min > limit:
+                return limit + 1
+            prev, cur = cur, prev
+        return min(prev[m], limit + 1)
+
+
+def _lev_back(expected: Sequence[str], predicted: Sequence[str]) -> bytes | bytearray:
     n = len(expected)
     m = len(predicted)
+    width = m + 1
 
-    dp = [[0] * (m + 1) for _ in range(n + 1)]
-    back: list[list[Op]] = [["match"] * (m + 1) for _ in range(n + 1)]
+    prev = array("i", range(width))
+    cur = array("i", [0]) * width
+    back = bytearray(width * (n + 1))
+    for j in range(1, width):
+        back[j] = OP_INS
 
     for i in range(1, n + 1):
-        dp[i][0] = i
-        back[i][0] = "del"
-    for j in range(1, m + 1):
-        dp[0][j] = j
-        back[0][j] = "ins"
+        e = expected[i - 1]
+        row = i * width
+        cur[0] = i
+        back[row] = OP_DEL
+        for j in range(1, width):
+            diag = prev[j - 1]
+            if e == predicted[j - 1]:
+                sub = diag
+                code = OP_MATCH
+            else:
+                sub = diag + 1
+                code = OP_SUB
+            dele = prev[j] + 1
+            ins = cur[j - 1] + 1
+            if sub <= dele and sub <= ins:
+                cur[j] = sub
+            elif dele <= ins:
+                cur[j] = dele
+                code = OP_DEL
+            else:
+                cur[j] = ins
+                code = OP_INS
+            back[row + j] = code
+        prev, cur = cur, prev
+    return back
 
-    for i in range(1, n + 1):
+
+def _lev_dist(expected: Sequence[str], predicted: Sequence[str], limit: int) -> int:
+    m = len(predicted)
+    prev = list(range(m + 1))
+    for i in range(1, len(expected) + 1):
+        e = expected[i - 1]
+        cur = [i] * (m + 1)
         for j in range(1, m + 1):
-            cost_sub = 0 if expected[i - 1] == predicted[j - 1] else 1
-            sub = dp[i - 1][j - 1] + cost_sub
-            dele = dp[i - 1][j] + 1
-            ins = dp[i][j - 1] + 1
-            best = min(sub, dele, ins)
-            dp[i][j] = best
-            if best == sub:
-                back[i][j] = "match" if cost_sub == 0 else "sub"
-            elif best == dele:
-                back[i][j] = "del"
-            else:
-                back[i][j] = "ins"
+            # Inline compares rather than min(): the call makes this loop ~1.7x slower.
+            best = prev[j - 1] + (e != predicted[j - 1])
+            if prev[j] + 1 < best:  # noqa: PLR1730
+                best = prev[j] + 1
+            if cur[j - 1] + 1 < best:  # noqa: PLR1730
+                best = cur[j - 1] + 1
+            cur[j] = best
+        if min(cur) > limit:
+            # Row minima never decrease, so the final distance is already over the limit.
+            return limit + 1
+        prev = cur
+    return min(prev[m], limit + 1)
+
+
+def levenshtein_ops(expected: Sequence[str], predicted: Sequence[str]) -> list[EditOp]:
+    """
+    Levenshtein DP that returns a stable edit script (prefers match/sub over indels on ties).
+
+    Scores use two rolling rows; the traceback is a flat (n+1)*(m+1) byte buffer.
+    The DP runs in a Numba kernel over interned token ids when numba is installed.
+    """
+    n = len(expected)
+    m = len(predicted)
+    width = m + 1
+    if _HAS_NUMBA:
+        _, back_arr = _lev_core(token_ids(expected), token_ids(predicted))
+        back = back_arr.tobytes()
+    else:
+        back = _lev_back(expected, predicted)
 
     ops: list[EditOp] = []
     i, j = n, m
     while i > 0 or j > 0:
-        step = back[i][j]
-        if step in {"match", "sub"}:
+        step = back[i * width + j]
+        if step == OP_MATCH or step == OP_SUB:
             ops.append(
-                EditOp(step, expected=expected[i - 1], predicted=predicted[j - 1])  # type: ignore[arg-type]
+                EditOp(
+                    "match" if step == OP_MATCH else "sub",
+                    expected=expected[i - 1],
+                    predicted=predicted[j - 1],
+                )
             )
             i -= 1
             j -= 1
-        elif step == "del":
+        elif step == OP_DEL:
             ops.append(EditOp("del", expected=expected[i - 1], predicted=None))
             i -= 1
         else:
@@ -68,8 +200,41 @@ def levenshtein_ops(expected: list[str], predicted: list[str]) -> list[EditOp]:
 
 
 def edit_counts(ops: list[EditOp]) -> tuple[int, int, int]:
-    subs = sum(1 for o in ops if o.op == "sub")
-    ins = sum(1 for o in ops if o.op == "ins")
-    dels = sum(1 for o in ops if o.op == "del")
-    return subs, ins, dels
+    c = Counter(o[0] for o in ops)
+    return c["sub"], c["ins"], c["del"]
+
+
+def levenshtein_distance(
+    expected: Sequence[str], predicted: Sequence[str], max_cost: int | None = None
+) -> int:
+    """
+    Edit distance only (no script). Uses RapidFuzz or a Numba kernel when installed.
+
+    With `max_cost`, any distance above it is reported as `max_cost + 1`, which lets the
+    DP stop as soon as every cell in a row exceeds the bound.
+    """
+    if _HAS_RAPIDFUZZ:
+        return _RFLevenshtein.distance(expected, predicted, score_cutoff=max_cost)
+
+    # A shared prefix/suffix never changes the distance; strip it before the DP.
+    lo = 0
+    n = len(expected)
+    m = len(predicted)
+    while lo < n and lo < m and expected[lo] == predicted[lo]:
+        lo += 1
+    while n > lo and m > lo and expected[n - 1] == predicted[m - 1]:
+        n -= 1
+        m -= 1
+    expected = expected[lo:n]
+    predicted = predicted[lo:m]
+    n -= lo
+    m -= lo
 
+    limit = max(n, m) if max_cost is None else max_cost
+    if abs(n - m) > limit:
+        return limit + 1
+    if n == 0 or m == 0:
+        return n + m
+    if _HAS_NUMBA:
+        return int(_lev_dist_core(token_ids(expected), token_ids(predicted), limit))
+    return _lev_dist(expected, predicted, limit)
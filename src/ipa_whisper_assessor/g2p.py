@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
+import importlib.metadata
 import json
+import os
+import re
+import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
-import yaml
-
 from .ipa_normalize import normalize_ipa_text
 
 
@@ -26,8 +30,20 @@ def _load_lexicon(path: str | None) -> dict[str, str]:
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(path)
+    st = p.stat()
+    # Keyed on mtime/size so an edited lexicon is re-read; callers must not mutate the dict.
+    return _parse_lexicon(str(p.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_lexicon(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    p = Path(path)
     if p.suffix.lower() in {".yml", ".yaml"}:
-        data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        import yaml
+
+        # Prefer the libyaml-backed loader when PyYAML was built with it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(p.read_text(encoding="utf-8"), Loader=loader) or {}
     elif p.suffix.lower() == ".json":
         data = json.loads(p.read_text(encoding="utf-8"))
     else:
@@ -37,33 +53,157 @@ def _load_lexicon(path: str | None) -> dict[str, str]:
     return {str(k).lower(): normalize_ipa_text(str(v)) for k, v in data.items()}
 
 
+def _g2p_cache_dir() -> Path:
+    root = os.environ.get("IPA_ASSESS_CACHE_DIR") or "~/.cache/ipa-assessor"
+    return Path(root).expanduser() / "g2p"
+
+
+def _cache_disabled() -> bool:
+    return os.environ.get("IPA_ASSESS_NO_CACHE", "").strip().lower() in {"1", "true", "yes"}
+
+
+@functools.lru_cache(maxsize=1)
+def _g2p_cache():
+    """
+    Persistent (backend, backend version, language, word) -> IPA cache, or None when
+    `diskcache` isn't installed or caching is disabled (`IPA_ASSESS_NO_CACHE=1`). Hit/miss
+    counting costs a write per lookup, so it is only on with `IPA_ASSESS_CACHE_STATS=1`.
+    """
+    if _cache_disabled():
+        return None
+    try:
+        from diskcache import Cache  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+
+    try:
+        cache = Cache(str(_g2p_cache_dir()))
+        stats = os.environ.get("IPA_ASSESS_CACHE_STATS", "").strip().lower() in {"1", "true", "yes"}
+        # The setting is persisted in the cache itself, so only write it when it changes.
+        if bool(cache.statistics) != stats:
+            cache.stats(enable=stats)
+    except (OSError, sqlite3.Error):
+        # Unwritable cache dir etc.; G2P still works, just uncached.
+        return None
+    return cache
+
+
+def _g2p_cache_settings() -> dict[str, object] | None:
+    """
+    diskcache's Settings table (count, hits, misses, statistics, ...) read straight from
+    SQLite in read-only mode, so reporting never creates or writes the cache. None when
+    the cache doesn't exist yet.
+    """
+    db = _g2p_cache_dir() / "cache.db"
+    if not db.is_file():
+        return None
+    try:
+        con = sqlite3.connect(f"{db.as_uri()}?mode=ro", uri=True)
+        try:
+            return dict(con.execute("SELECT key, value FROM Settings").fetchall())
+        finally:
+            con.close()
+    except sqlite3.Error:
+        return None
+
+
+def _dist_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+@functools.lru_cache(maxsize=4)
+def _backend_version(backend: str) -> str:
+    """
+    Part of every cache key, so upgrading phonemizer/espeak-ng or the CMU dictionary
+    invalidates the entries they produced instead of serving stale IPA.
+    """
+    if backend == "espeak":
+        try:
+            from phonemizer.backend import EspeakBackend  # type: ignore[import-not-found]
+
+            espeak = ".".join(map(str, EspeakBackend.version()))
+        except (ImportError, RuntimeError):
+            espeak = ""
+        return f"phonemizer={_dist_version('phonemizer')};espeak-ng={espeak}"
+    return f"pronouncing={_dist_version('pronouncing')};cmudict={_dist_version('cmudict')}"
+
+
+def _cached_g2p(words: list[str], options: G2POptions, lex: dict[str, str], convert) -> list[str]:
+    cache = _g2p_cache()
+    if cache is None:
+        return convert(words, lex)
+
+    version = _backend_version(options.backend)
+    out: list[str] = [""] * len(words)
+    misses: list[int] = []
+    for i, w in enumerate(words):
+        lw = w.lower()
+        if lw in lex:
+            out[i] = lex[lw]
+            continue
+        hit = cache.get((options.backend, version, options.language, w))
+        if hit is None:
+            misses.append(i)
+        else:
+            out[i] = hit
+    if misses:
+        for i, ipa in zip(misses, convert([words[i] for i in misses], lex)):
+            out[i] = ipa
+            cache.set((options.backend, version, options.language, words[i]), ipa)
+    return out
+
+
 def g2p_words(words: list[str], options: G2POptions) -> list[str]:
     lex = _load_lexicon(options.lexicon_path)
     out: list[str] = []
     if options.backend == "espeak":
-        out = _g2p_espeak(words, options.language, lex)
+        out = _cached_g2p(
+            words, options, lex, lambda ws, lx: _g2p_espeak(ws, options.language, lx)
+        )
     elif options.backend == "cmudict":
-        out = _g2p_cmudict(words, lex)
+        out = _cached_g2p(words, options, lex, lambda ws, lx: _g2p_cmudict(ws, lx))
     else:
         raise ValueError(f"Unknown G2P backend: {options.backend}")
     return [normalize_ipa_text(x) for x in out]
 
 
-def _g2p_espeak(words: list[str], language: str, lex: dict[str, str]) -> list[str]:
+# libespeak keeps global state; serialize calls from concurrent `batch --workers` threads.
+_ESPEAK_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _espeak_backend(language: str, with_stress: bool = True):
     try:
         from phonemizer.backend import EspeakBackend  # type: ignore[import-not-found]
     except Exception as e:  # pragma: no cover
         raise RuntimeError("Missing g2p dependencies. Install with: pip install -e '.[g2p]'") from e
 
-    backend = EspeakBackend(language=language, preserve_punctuation=False, with_stress=True)
-    out: list[str] = []
-    for w in words:
+    return EspeakBackend(language=language, preserve_punctuation=False, with_stress=with_stress)
+
+
+def _g2p_espeak(words: list[str], language: str, lex: dict[str, str]) -> list[str]:
+    out: list[str] = [""] * len(words)
+    todo: list[int] = []
+    for i, w in enumerate(words):
         lw = w.lower()
         if lw in lex:
-            out.append(lex[lw])
-            continue
-        # phonemizer returns a string; for single word, strip.
-        out.append(backend.phonemize([w], strip=True)[0])
+            out[i] = lex[lw]
+        else:
+            todo.append(i)
+    if not todo:
+        return out
+
+    backend = _espeak_backend(language, True)
+    # One in-process call for all lexicon misses; phonemizer returns one string per input line.
+    # njobs stays 1: njobs > 1 ships the backend to joblib worker processes, which costs far more
+    # than phonemizing a sentence's worth of words.
+    with _ESPEAK_LOCK:
+        results = backend.phonemize([words[i] for i in todo], strip=True, njobs=1)
+    for i, ipa in zip(todo, results):
+        out[i] = ipa
     return out
 
 
@@ -110,20 +250,19 @@ _ARPABET_TO_IPA = {
 }
 
 
+_ARPA_RE = re.compile(r"([A-Z]+)([012]?)")
+_STRESS_MARKS = {"1": "ˈ", "2": "ˌ"}
+
+
 def _arpabet_pron_to_ipa(pron: str) -> str:
     phones: list[str] = []
-    for part in pron.split():
-        stress = None
-        if part and part[-1] in "012":
-            stress = part[-1]
-        base = part.rstrip("012")
-        ipa = _ARPABET_TO_IPA.get(base)
+    for m in _ARPA_RE.finditer(pron):
+        ipa = _ARPABET_TO_IPA.get(m.group(1))
         if ipa is None:
             continue
-        if stress == "1":
-            phones.append("ˈ")
-        elif stress == "2":
-            phones.append("ˌ")
+        mark = _STRESS_MARKS.get(m.group(2))
+        if mark is not None:
+            phones.append(mark)
         phones.append(ipa)
     return "".join(phones)
 
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import functools
+import re
+import sys
+import threading
 import unicodedata
+from collections.abc import Sequence
 
 
 _STRESS = {"ˈ", "ˌ"}
@@ -24,72 +29,79 @@ _MULTI = [
 ]
 
 
-def _greedy_scan(s: str) -> list[str]:
-    tokens: list[str] = []
-    i = 0
-    while i < len(s):
-        ch = s[i]
-        if ch in _WORD_BREAKS:
-            i += 1
-            continue
+# One alternation tried in the same priority order as a left-to-right greedy scan:
+# whitespace, stress marks, multi-symbol phones (longest first), tie-bar triples
+# (e.g. affricates with combining marks), then any single character.
+_TOKEN_RE = re.compile(
+    "|".join(
+        [
+            "[" + "".join(sorted(_WORD_BREAKS)) + "]",
+            "[" + "".join(sorted(_STRESS)) + "]",
+            *(re.escape(m) for m in sorted(_MULTI, key=len, reverse=True)),
+            "[^" + "".join(sorted(_WORD_BREAKS)) + "][" + "".join(sorted(_TIE_BARS)) + "].",
+            ".",
+        ]
+    ),
+    re.DOTALL,
+)
 
-        if ch in _STRESS:
-            tokens.append(ch)
-            i += 1
-            continue
-
-        matched = None
-        for m in _MULTI:
-            if s.startswith(m, i):
-                matched = m
-                break
-        if matched is not None:
-            tokens.append(matched)
-            i += len(matched)
-            continue
 
-        # Capture tie-bar affricates even if not covered (e.g., with combining marks).
-        if i + 2 < len(s) and s[i + 1] in _TIE_BARS:
-            tokens.append(s[i : i + 3])
-            i += 3
+def _greedy_scan(s: str) -> list[str]:
+    tokens: list[str] = []
+    for tok in _TOKEN_RE.findall(s):
+        if tok in _WORD_BREAKS:
             continue
-
         # Attach diacritics/length to previous token when possible.
-        if ch in _DIACRITICS_ATTACH_TO_PREV and tokens:
-            tokens[-1] = tokens[-1] + ch
-            i += 1
+        if tok in _DIACRITICS_ATTACH_TO_PREV and tokens:
+            tokens[-1] = tokens[-1] + tok
             continue
-
-        tokens.append(ch)
-        i += 1
+        tokens.append(tok)
     return tokens
 
 
-def tokenize_ipa(text: str) -> list[str]:
+@functools.lru_cache(maxsize=200_000)
+def tokenize_ipa(text: str) -> tuple[str, ...]:
     """
     Tokenize an IPA string into a sequence suitable for Levenshtein alignment.
 
+    Results are memoized (the same words recur across an utterance and a batch), so the
+    return value is an immutable tuple.
+
     - Drops whitespace.
     - Keeps stress marks as tokens.
     - Greedy longest-match for multi-symbol phones.
     - Attaches length/diacritics to previous token.
     """
     text = unicodedata.normalize("NFC", text)
-    return _greedy_scan(text)
+    # Interned: the phoneme alphabet is tiny, so equal tokens share one object across calls.
+    return tuple(map(sys.intern, _greedy_scan(text)))
+
+
+# Token -> small int id, shared by all callers so ids are stable within a process.
+_TOKEN_VOCAB: dict[str, int] = {}
+_VOCAB_LOCK = threading.Lock()
+
+
+def token_ids(tokens: Sequence[str]):
+    """
+    Map tokens to an int32 numpy array of vocabulary ids (growing the vocabulary on miss).
+    """
+    import numpy as np
+
+    ids = np.empty(len(tokens), dtype=np.int32)
+    for k, tok in enumerate(tokens):
+        i = _TOKEN_VOCAB.get(tok)
+        if i is None:
+            with _VOCAB_LOCK:
+                i = _TOKEN_VOCAB.setdefault(tok, len(_TOKEN_VOCAB))
+        ids[k] = i
+    return ids
+
+
+# Runs of alphanumerics (`\w` minus underscore) plus apostrophes and hyphens.
+_REFERENCE_WORD_RE = re.compile(r"(?:[^\W_]|['’-])+")
 
 
 def split_reference_words(reference: str) -> list[str]:
     # Minimal word split (keep punctuation out of word forms for G2P).
-    parts: list[str] = []
-    buff: list[str] = []
-    for ch in reference.strip():
-        if ch.isalnum() or ch in {"'", "’", "-"}:
-            buff.append(ch)
-        else:
-            if buff:
-                parts.append("".join(buff))
-                buff = []
-    if buff:
-        parts.append("".join(buff))
-    return parts
-
+    return _REFERENCE_WORD_RE.findall(reference)
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
 import html
+import re
+from collections.abc import Callable
 from pathlib import Path
 
-from .schemas import AssessmentResult
+from .schemas import AssessmentResult, MistakeEvent, PhonemeOp, WordAlignment
+
+try:
+    import jinja2  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    jinja2 = None
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# JSON strings (skipped) or the 'e' of a positive float exponent outside any string.
+_JSON_POS_EXP = re.compile(rb'"(?:[^"\\]|\\.)*"|(?<=\d)e(?=\d)')
+
+
+def _pos_exp_sign(m: re.Match[bytes]) -> bytes:
+    return b"e+" if m.group() == b"e" else m.group()
 
 
 def write_json(result: AssessmentResult, path: str | Path) -> None:
+    if orjson is not None:
+        data = orjson.dumps(
+            result.model_dump(mode="json"), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        # orjson writes 1e20 where pydantic writes 1e+20; match pydantic so output
+        # doesn't depend on whether orjson is installed.
+        Path(path).write_bytes(_JSON_POS_EXP.sub(_pos_exp_sign, data))
+        return
     Path(path).write_text(result.model_dump_json(indent=2), encoding="utf-8")
 
 
@@ -16,63 +44,83 @@ def _fmt_time(t: float | None) -> str:
     return f"{t:.2f}s"
 
 
-def write_html(result: AssessmentResult, path: str | Path) -> None:
-    rows = []
-    for w in result.word_alignments:
-        ops = []
-        for o in w.phoneme_ops:
-            if o.op == "sub":
-                ops.append(f"<span class='sub'>{html.escape(o.expected or '')}→{html.escape(o.predicted or '')}</span>")
-            elif o.op == "ins":
-                ops.append(f"<span class='ins'>+{html.escape(o.predicted or '')}</span>")
-            elif o.op == "del":
-                ops.append(f"<span class='del'>-{html.escape(o.expected or '')}</span>")
-        rows.append(
-            "<tr>"
-            f"<td>{html.escape(_fmt_time(w.start))}–{html.escape(_fmt_time(w.end))}</td>"
-            f"<td>{html.escape(w.reference_word)}</td>"
-            f"<td class='mono'>{html.escape(w.expected_ipa)}</td>"
-            f"<td class='mono'>{html.escape(w.predicted_ipa)}</td>"
-            f"<td class='mono'>{' '.join(ops)}</td>"
-            "</tr>"
-        )
+_HTML_SPECIAL = re.compile(r"[&<>\"']").search
+
+
+def _esc(s: str | None) -> str:
+    """
+    html.escape for table cells; None/'' become '' and strings with nothing to escape
+    (the usual case for IPA) are returned as-is after a single C-level scan.
+    """
+    if not s:
+        return ""
+    return html.escape(s) if _HTML_SPECIAL(s) else s
+
+
+# Op -> cell formatter for the fallback writer; "match" has no entry and is skipped.
+_OP_FMT: dict[str, Callable[[PhonemeOp], str]] = {
+    "sub": lambda o: f"<span class='sub'>{_esc(o.expected)}→{_esc(o.predicted)}</span>",
+    "ins": lambda o: f"<span class='ins'>+{_esc(o.predicted)}</span>",
+    "del": lambda o: f"<span class='del'>-{_esc(o.expected)}</span>",
+}
+
+
+def _row(w: WordAlignment) -> str:
+    ops: list[str] = []
+    ops_append = ops.append
+    op_fmt = _OP_FMT.get
+    for o in w.phoneme_ops:
+        fmt = op_fmt(o.op)
+        if fmt is not None:
+            ops_append(fmt(o))
+    return (
+        "<tr>"
+        # _fmt_time only yields digits, '.', 's' or '', so it needs no escaping.
+        f"<td>{_fmt_time(w.start)}–{_fmt_time(w.end)}</td>"
+        f"<td>{_esc(w.reference_word)}</td>"
+        f"<td class='mono'>{_esc(w.expected_ipa)}</td>"
+        f"<td class='mono'>{_esc(w.predicted_ipa)}</td>"
+        f"<td class='mono'>{' '.join(ops)}</td>"
+        "</tr>"
+    )
 
-    mistake_rows = []
-    for m in result.mistakes:
-        mistake_rows.append(
-            "<tr>"
-            f"<td>{html.escape(m.rule)}</td>"
-            f"<td class='mono'>{html.escape(m.expected or '')}</td>"
-            f"<td class='mono'>{html.escape(m.predicted or '')}</td>"
-            f"<td>{m.count}</td>"
-            "</tr>"
-        )
 
-    mistake_body = "".join(mistake_rows) or "<tr><td colspan='4'>(none)</td></tr>"
+def _mistake_row(m: MistakeEvent) -> str:
+    return (
+        "<tr>"
+        f"<td>{_esc(m.rule)}</td>"
+        f"<td class='mono'>{_esc(m.expected)}</td>"
+        f"<td class='mono'>{_esc(m.predicted)}</td>"
+        f"<td>{m.count}</td>"
+        "</tr>"
+    )
 
-    html_doc = f"""<!doctype html>
+
+_NO_WORD_ROWS = "<tr><td colspan='5'>(none)</td></tr>"
+_NO_MISTAKE_ROWS = "<tr><td colspan='4'>(none)</td></tr>"
+
+# Static parts of the fallback (no-jinja2) document; only the summary and table bodies vary.
+_HEAD = """<!doctype html>
 <html>
 <head>
   <meta charset="utf-8"/>
   <title>IPA Assessment Report</title>
   <style>
-    body {{ font-family: -apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; }}
-    .mono {{ font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    th, td {{ border: 1px solid #ddd; padding: 8px; vertical-align: top; }}
-    th {{ background: #f7f7f7; text-align: left; }}
-    .sub {{ color: #b91c1c; font-weight: 600; }}
-    .ins {{ color: #0f766e; }}
-    .del {{ color: #7c3aed; }}
+    body { font-family: -apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; }
+    .mono { font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ddd; padding: 8px; vertical-align: top; }
+    th { background: #f7f7f7; text-align: left; }
+    .sub { color: #b91c1c; font-weight: 600; }
+    .ins { color: #0f766e; }
+    .del { color: #7c3aed; }
   </style>
 </head>
 <body>
   <h1>IPA Assessment Report</h1>
-  <p><b>Audio:</b> {html.escape(result.audio_path)}</p>
-  <p><b>Model:</b> {html.escape(result.model)}</p>
-  <p><b>Reference:</b> {html.escape(result.reference)}</p>
-  <p><b>PER:</b> {result.metrics.phoneme_error_rate:.3f} (S:{result.metrics.substitutions} I:{result.metrics.insertions} D:{result.metrics.deletions})</p>
+"""
 
+_ROWS_OPEN = """
   <h2>Word Alignment</h2>
   <table>
     <thead>
@@ -85,7 +133,9 @@ def write_html(result: AssessmentResult, path: str | Path) -> None:
       </tr>
     </thead>
     <tbody>
-      {''.join(rows)}
+      """
+
+_MID = """
     </tbody>
   </table>
 
@@ -95,10 +145,86 @@ def write_html(result: AssessmentResult, path: str | Path) -> None:
       <tr><th>Rule</th><th>Expected</th><th>Predicted</th><th>Count</th></tr>
     </thead>
     <tbody>
-      {mistake_body}
+      """
+
+_TAIL = """
     </tbody>
   </table>
 </body>
 </html>
 """
-    Path(path).write_text(html_doc, encoding="utf-8")
+
+
+def _finalize(value) -> str:
+    # Every {{ }} in the template goes through here, so both writers escape identically.
+    if value is None:
+        return ""
+    return _esc(value if isinstance(value, str) else str(value))
+
+
+# The template is the same skeleton with Jinja loops in place of the Python-built parts.
+_HTML_TEMPLATE_SRC = (
+    _HEAD
+    + "  <p><b>Audio:</b> {{ result.audio_path }}</p>\n"
+    "  <p><b>Model:</b> {{ result.model }}</p>\n"
+    "  <p><b>Reference:</b> {{ result.reference }}</p>\n"
+    "{% set m = result.metrics %}"
+    "  <p><b>PER:</b> {{ '%.3f'|format(m.phoneme_error_rate) }} "
+    "(S:{{ m.substitutions }} I:{{ m.insertions }} D:{{ m.deletions }})</p>\n"
+    + _ROWS_OPEN
+    + "{% for w in result.word_alignments %}"
+    "<tr><td>{{ w.start|fmt_time }}–{{ w.end|fmt_time }}</td><td>{{ w.reference_word }}</td>"
+    "<td class='mono'>{{ w.expected_ipa }}</td><td class='mono'>{{ w.predicted_ipa }}</td>"
+    "<td class='mono'>"
+    "{% for o in w.phoneme_ops if o.op != 'match' %}{% if not loop.first %} {% endif %}"
+    "{% if o.op == 'sub' %}<span class='sub'>{{ o.expected }}→{{ o.predicted }}</span>"
+    "{% elif o.op == 'ins' %}<span class='ins'>+{{ o.predicted }}</span>"
+    "{% elif o.op == 'del' %}<span class='del'>-{{ o.expected }}</span>"
+    "{% endif %}{% endfor %}</td></tr>"
+    "{% else %}" + _NO_WORD_ROWS + "{% endfor %}"
+    + _MID
+    + "{% for m in result.mistakes %}"
+    "<tr><td>{{ m.rule }}</td><td class='mono'>{{ m.expected }}</td>"
+    "<td class='mono'>{{ m.predicted }}</td><td>{{ m.count }}</td></tr>"
+    "{% else %}" + _NO_MISTAKE_ROWS + "{% endfor %}"
+    + _TAIL
+)
+
+if jinja2 is not None:
+    # Escaping is done by _finalize (same entities as the fallback writer), not autoescape.
+    _ENV = jinja2.Environment(
+        autoescape=False, finalize=_finalize, auto_reload=False, keep_trailing_newline=True
+    )
+    _ENV.filters["fmt_time"] = _fmt_time
+    # Compiled once at import; write_html only renders.
+    _TEMPLATE = _ENV.from_string(_HTML_TEMPLATE_SRC)
+else:  # pragma: no cover
+    _TEMPLATE = None
+
+
+def write_html(result: AssessmentResult, path: str | Path) -> None:
+    if _TEMPLATE is not None:
+        # Stream rendered chunks into a large write buffer instead of materializing the document.
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+            _TEMPLATE.stream(result=result).dump(fh)
+        return
+
+    if result.word_alignments:
+        rows_html = "".join(map(_row, result.word_alignments))
+    else:
+        rows_html = _NO_WORD_ROWS
+    if result.mistakes:
+        mistake_body = "".join(map(_mistake_row, result.mistakes))
+    else:
+        mistake_body = _NO_MISTAKE_ROWS
+
+    metrics = result.metrics
+    summary = (
+        f"  <p><b>Audio:</b> {_esc(result.audio_path)}</p>\n"
+        f"  <p><b>Model:</b> {_esc(result.model)}</p>\n"
+        f"  <p><b>Reference:</b> {_esc(result.reference)}</p>\n"
+        f"  <p><b>PER:</b> {metrics.phoneme_error_rate:.3f} "
+        f"(S:{metrics.substitutions} I:{metrics.insertions} D:{metrics.deletions})</p>\n"
+    )
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.writelines([_HEAD, summary, _ROWS_OPEN, rows_html, _MID, mistake_body, _TAIL])
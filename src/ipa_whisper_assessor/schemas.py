@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class IpaWord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ipa: str
     start: Optional[float] = None
     end: Optional[float] = None
@@ -20,12 +22,16 @@ class TranscriptionResult(BaseModel):
 
 
 class PhonemeOp(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     op: Literal["match", "sub", "ins", "del"]
     expected: Optional[str] = None
     predicted: Optional[str] = None
 
 
 class WordAlignment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     word_index: int
     reference_word: str
     expected_ipa: str
@@ -36,6 +42,8 @@ class WordAlignment(BaseModel):
 
 
 class MistakeEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     rule: str
     expected: Optional[str] = None
     predicted: Optional[str] = None
@@ -43,6 +51,8 @@ class MistakeEvent(BaseModel):
 
 
 class AssessmentMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     phoneme_error_rate: float
     substitutions: int
     insertions: int
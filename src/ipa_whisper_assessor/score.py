@@ -1,34 +1,60 @@
 from __future__ import annotations
 
-from collections import Counter
-
 from .edit_distance import EditOp
 
+_MISTAKE_RULES: dict[tuple[str, str], str] = {
+    ("z", "s"): "VOICING_ERROR_FRICATIVE",
+    ("s", "z"): "VOICING_ERROR_FRICATIVE",
+    ("θ", "s"): "TH_FRONTING_OR_STOPPING",
+    ("ð", "d"): "TH_FRONTING_OR_STOPPING",
+    ("ð", "z"): "TH_FRONTING_OR_STOPPING",
+    ("ɪ", "i"): "VOWEL_TENSE_LAX",
+    ("i", "ɪ"): "VOWEL_TENSE_LAX",
+    ("ʊ", "u"): "VOWEL_TENSE_LAX",
+    ("u", "ʊ"): "VOWEL_TENSE_LAX",
+}
 
-def substitution_histogram(ops: list[EditOp]) -> dict[str, int]:
-    c: Counter[str] = Counter()
-    for o in ops:
-        if o.op == "sub" and o.expected is not None and o.predicted is not None:
-            c[f"{o.expected}→{o.predicted}"] += 1
-    return dict(c)
 
-
-def apply_default_mistake_rules(ops: list[EditOp]) -> list[tuple[str, str, str, int]]:
+def summarize(
+    ops: list[EditOp],
+) -> tuple[dict[str, int], list[tuple[str, str, str, int]], int, int, int]:
     """
-    Return (rule, expected, predicted, count).
-    Keep this small and conservative; customize later via YAML if desired.
+    Single pass over `ops` returning (substitution_histogram, mistakes, subs, ins, dels).
     """
-    c = Counter()
+    hist: dict[str, int] = {}
+    c: dict[tuple[str, str, str], int] = {}
+    subs = ins = dels = 0
     for o in ops:
-        if o.op != "sub" or o.expected is None or o.predicted is None:
+        op = o.op
+        if op == "match":
+            continue
+        if op == "ins":
+            ins += 1
             continue
+        if op == "del":
+            dels += 1
+            continue
+        subs += 1
         e = o.expected
         p = o.predicted
-        if (e, p) in {("z", "s"), ("s", "z")}:
-            c[("VOICING_ERROR_FRICATIVE", e, p)] += 1
-        elif (e, p) in {("θ", "s"), ("ð", "d"), ("ð", "z")}:
-            c[("TH_FRONTING_OR_STOPPING", e, p)] += 1
-        elif (e, p) in {("ɪ", "i"), ("i", "ɪ"), ("ʊ", "u"), ("u", "ʊ")}:
-            c[("VOWEL_TENSE_LAX", e, p)] += 1
-    return [(rule, e, p, n) for (rule, e, p), n in c.items()]
+        if e is None or p is None:
+            continue
+        k = e + "→" + p
+        hist[k] = hist.get(k, 0) + 1
+        rule = _MISTAKE_RULES.get((e, p))
+        if rule is not None:
+            key = (rule, e, p)
+            c[key] = c.get(key, 0) + 1
+    return hist, [(rule, e, p, n) for (rule, e, p), n in c.items()], subs, ins, dels
 
+
+def substitution_histogram(ops: list[EditOp]) -> dict[str, int]:
+    return summarize(ops)[0]
+
+
+def apply_default_mistake_rules(ops: list[EditOp]) -> list[tuple[str, str, str, int]]:
+    """
+    Return (rule, expected, predicted, count).
+    Keep this small and conservative; customize later via YAML if desired.
+    """
+    return summarize(ops)[1]
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import os
+import threading
 from dataclasses import dataclass
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from .ipa_normalize import normalize_chunk_word, normalize_ipa_text
-from .schemas import IpaWord, TranscriptionResult
+
+if TYPE_CHECKING:
+    from .schemas import IpaWord, TranscriptionResult
 
 MODEL_ID = "neurlang/ipa-whisper-small"
 
@@ -42,14 +48,37 @@ def _resolve_device(device: Device) -> int | str:
     raise ValueError(f"Unknown device: {device}")
 
 
-_PIPELINE = None
+# Keyed so a different model/device/chunk length gets its own pipeline instead of the first one.
+_PIPELINES: dict[tuple[str, str, int], Any] = {}
+_PIPELINES_LOCK = threading.Lock()
+
+
+def _resolve_dtype(torch: Any, resolved: int | str):
+    """
+    float16 on CUDA/MPS; on CPU bfloat16 only when the CPU has native BF16, else float32.
+    """
+    if resolved in (0, "mps"):
+        return torch.float16
+    bf16_supported = getattr(getattr(torch, "cpu", None), "_is_avx512_bf16_supported", None)
+    if bf16_supported is not None and bf16_supported():
+        return torch.bfloat16
+    return torch.float32
 
 
 def _get_pipeline(model_id: str, device: Device, chunk_length_s: int):
-    global _PIPELINE
-    if _PIPELINE is not None:
-        return _PIPELINE
+    key = (model_id, device, chunk_length_s)
+    p = _PIPELINES.get(key)
+    if p is not None:
+        return p
+    with _PIPELINES_LOCK:
+        p = _PIPELINES.get(key)
+        if p is None:
+            p = _build_pipeline(model_id, device, chunk_length_s)
+            _PIPELINES[key] = p
+    return p
+
 
+def _build_pipeline(model_id: str, device: Device, chunk_length_s: int):
     try:
         from transformers import pipeline  # type: ignore[import-not-found]
     except Exception as e:  # pragma: no cover
@@ -57,12 +86,22 @@ def _get_pipeline(model_id: str, device: Device, chunk_length_s: int):
             "Missing transcribe dependencies. Install with: pip install -e '.[transcribe]'"
         ) from e
 
+    resolved = _resolve_device(device)
+    extra: dict[str, Any] = {}
+    with contextlib.suppress(Exception):
+        import torch  # type: ignore[import-not-found]
+
+        # Allow TF32 matmuls on hardware that has them; set here rather than at import time.
+        torch.set_float32_matmul_precision("high")
+        extra["torch_dtype"] = _resolve_dtype(torch, resolved)
+
     p = pipeline(
         "automatic-speech-recognition",
         model=model_id,
         chunk_length_s=chunk_length_s,
-        device=_resolve_device(device),
+        device=resolved,
         ignore_warning=True,
+        **extra,
     )
 
     # Model-card-recommended settings for IPA mode.
@@ -77,16 +116,48 @@ def _get_pipeline(model_id: str, device: Device, chunk_length_s: int):
         # Best-effort; some pipelines may wrap differently.
         pass
 
-    _PIPELINE = p
+    compile_opt = os.environ.get("IPA_ASSESS_TORCH_COMPILE", "").strip().lower()
+    if resolved == 0 and compile_opt in {"1", "true", "yes"}:
+        # Opt-in: compilation happens lazily on the first call, so errors there aren't caught here.
+        with contextlib.suppress(Exception):
+            import torch  # type: ignore[import-not-found]
+
+            model = p.model  # type: ignore[attr-defined]
+            model.generate = torch.compile(model.generate, mode="reduce-overhead", fullgraph=False)
+
     return p
 
 
-def transcribe_audio(audio_path: str, options: TranscribeOptions) -> TranscriptionResult:
-    p = _get_pipeline(options.model, options.device, options.chunk_length_s)
-    kwargs: dict[str, Any] = {}
-    if options.timestamps is not None:
-        kwargs["return_timestamps"] = options.timestamps
-    out = p(audio_path, **kwargs)
+# HF pipelines aren't thread-safe (shared tokenizer/feature-extractor state), so concurrent
+# `batch --workers` threads run inference one at a time; decoding, G2P and reporting overlap.
+_INFERENCE_LOCK = threading.Lock()
+
+
+def _inference_mode():
+    try:
+        import torch  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover
+        return contextlib.nullcontext()
+    return torch.inference_mode()
+
+
+def load_pipeline(options: TranscribeOptions):
+    """
+    Build (or fetch the cached) ASR pipeline for `options`, e.g. to reuse across a batch.
+    """
+    return _get_pipeline(options.model, options.device, options.chunk_length_s)
+
+
+@functools.lru_cache(maxsize=16)
+def _kwargs_for(timestamps: str | None) -> dict[str, Any]:
+    # Shared between calls; only ever unpacked with **, never mutated.
+    return {"return_timestamps": timestamps} if timestamps is not None else {}
+
+
+def _out_to_result(
+    audio_path: str, out: dict[str, Any], options: TranscribeOptions
+) -> TranscriptionResult:
+    from .schemas import IpaWord, TranscriptionResult
 
     ipa_text = normalize_ipa_text(out.get("text", ""))
     words: list[IpaWord] = []
@@ -97,8 +168,9 @@ def transcribe_audio(audio_path: str, options: TranscribeOptions) -> Transcripti
         if isinstance(ts, (tuple, list)) and len(ts) == 2:
             start, end = ts[0], ts[1]
         raw = chunk.get("text", "")
+        # Fields are already the right types here, so skip pydantic validation.
         words.append(
-            IpaWord(
+            IpaWord.model_construct(
                 ipa=normalize_chunk_word(raw),
                 raw=raw,
                 start=float(start) if start is not None else None,
@@ -106,4 +178,39 @@ def transcribe_audio(audio_path: str, options: TranscribeOptions) -> Transcripti
             )
         )
 
-    return TranscriptionResult(audio_path=audio_path, model=options.model, ipa_text=ipa_text, ipa_words=words)
+    return TranscriptionResult.model_construct(
+        audio_path=audio_path, model=options.model, ipa_text=ipa_text, ipa_words=words
+    )
+
+
+def transcribe_audio(
+    audio_path: str, options: TranscribeOptions, pipe: Any = None
+) -> TranscriptionResult:
+    from .audio import load_audio_16k_mono
+
+    p = pipe if pipe is not None else load_pipeline(options)
+    # Decode in-process and hand the pipeline raw samples (it would otherwise spawn ffmpeg).
+    audio, sr = load_audio_16k_mono(audio_path)
+    with _INFERENCE_LOCK, _inference_mode():
+        out = p({"raw": audio, "sampling_rate": sr}, **_kwargs_for(options.timestamps))
+    return _out_to_result(audio_path, out, options)
+
+
+def transcribe_batch(
+    audio_paths: list[str], options: TranscribeOptions, batch_size: int = 8, pipe: Any = None
+) -> list[TranscriptionResult]:
+    """
+    Transcribe several files in one pipeline call so the model sees `batch_size` inputs at once.
+    """
+    from .audio import load_audio_16k_mono
+
+    if not audio_paths:
+        return []
+    p = pipe if pipe is not None else load_pipeline(options)
+    inputs = []
+    for path in audio_paths:
+        audio, sr = load_audio_16k_mono(path)
+        inputs.append({"raw": audio, "sampling_rate": sr})
+    with _INFERENCE_LOCK, _inference_mode():
+        outs = p(inputs, batch_size=batch_size, **_kwargs_for(options.timestamps))
+    return [_out_to_result(path, out, options) for path, out in zip(audio_paths, outs)]
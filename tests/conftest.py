@@ -0,0 +1,12 @@
+import pytest
+
+from ipa_whisper_assessor import g2p
+
+
+@pytest.fixture(autouse=True)
+def _no_g2p_disk_cache(monkeypatch):
+    # Keep tests away from the developer's real ~/.cache/ipa-assessor.
+    monkeypatch.setenv("IPA_ASSESS_NO_CACHE", "1")
+    g2p._g2p_cache.cache_clear()
+    yield
+    g2p._g2p_cache.cache_clear()
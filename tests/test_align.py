@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 from ipa_whisper_assessor.align import PredWord, align_words
 
 
@@ -10,3 +13,19 @@ def test_align_substitution_z_to_s():
     ops = aligned[0].phoneme_ops
     assert any(o.op == "sub" and o.expected == "z" and o.predicted == "s" for o in ops)
 
+
+def test_align_deleted_word_keeps_order():
+    ref_words = ["the", "zoo"]
+    expected = ["ðə", "zuː"]
+    predicted = [PredWord(ipa="suː", start=0.0, end=0.5)]
+    aligned = align_words(ref_words, expected, predicted)
+    assert [a.reference_word for a in aligned] == ["the", "zoo"]
+    assert aligned[0].predicted_ipa == ""
+    assert [o.op for o in aligned[0].phoneme_ops] == ["del", "del"]
+    assert aligned[1].start == 0.0
+
+
+def test_aligned_word_copies_and_pickles():
+    aligned = align_words(["zoo"], ["zuː"], [PredWord(ipa="suː", start=0.0, end=0.5)])[0]
+    assert copy.copy(aligned) == aligned
+    assert pickle.loads(pickle.dumps(aligned)) == aligned
@@ -0,0 +1,40 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("soxr")
+
+from ipa_whisper_assessor.audio import load_audio_16k_mono
+
+
+def test_load_audio_resamples_and_downmixes(tmp_path):
+    path = tmp_path / "tone.wav"
+    t = np.arange(8000) / 8000
+    stereo = np.stack([np.sin(2 * np.pi * 440 * t)] * 2, axis=1).astype(np.float32)
+    sf.write(path, stereo, 8000)
+
+    audio, sr = load_audio_16k_mono(path)
+    assert sr == 16000
+    assert audio.dtype == np.float32
+    assert audio.ndim == 1
+    assert abs(len(audio) - 16000) <= 1
+
+
+def test_load_audio_missing_file_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_audio_16k_mono(tmp_path / "missing.wav")
+
+
+def test_load_audio_sends_urls_to_ffmpeg(monkeypatch):
+    from ipa_whisper_assessor import audio
+
+    seen = []
+
+    def fake_ffmpeg(path):
+        seen.append(path)
+        return np.zeros(4, dtype=np.float32), 16000
+
+    monkeypatch.setattr(audio, "load_audio_16k_mono_ffmpeg", fake_ffmpeg)
+    pcm, _ = load_audio_16k_mono("https://example.com/a.wav")
+    assert seen == ["https://example.com/a.wav"]
+    assert pcm.dtype == np.float32
@@ -0,0 +1,50 @@
+import pytest
+
+from ipa_whisper_assessor import edit_distance
+from ipa_whisper_assessor.edit_distance import edit_counts, levenshtein_distance, levenshtein_ops
+
+
+@pytest.mark.parametrize("backend", ["default", "python"])
+def test_distance_matches_edit_script(monkeypatch, backend):
+    if backend == "python":
+        monkeypatch.setattr(edit_distance, "_HAS_RAPIDFUZZ", False)
+        monkeypatch.setattr(edit_distance, "_HAS_NUMBA", False)
+    pairs = [
+        (["z", "uː"], ["s", "uː"]),
+        (["c", "a", "b"], ["b", "c", "b"]),
+        ([], ["a", "b"]),
+        (["ð", "ə"], []),
+    ]
+    for e, p in pairs:
+        assert levenshtein_distance(e, p) == sum(edit_counts(levenshtein_ops(e, p)))
+
+
+def _script(expected, predicted):
+    return [(o.op, o.expected, o.predicted) for o in levenshtein_ops(expected, predicted)]
+
+
+def test_ops_prefer_substitution_on_ties(monkeypatch):
+    expected = [("sub", "c", "b"), ("sub", "a", "c"), ("match", "b", "b")]
+    assert _script(["c", "a", "b"], ["b", "c", "b"]) == expected
+    monkeypatch.setattr(edit_distance, "_HAS_NUMBA", False)
+    assert _script(["c", "a", "b"], ["b", "c", "b"]) == expected
+
+
+@pytest.mark.parametrize("backend", ["default", "numba", "python"])
+def test_max_cost_caps_distance(monkeypatch, backend):
+    if backend != "default":
+        monkeypatch.setattr(edit_distance, "_HAS_RAPIDFUZZ", False)
+    if backend == "python":
+        monkeypatch.setattr(edit_distance, "_HAS_NUMBA", False)
+    pairs = [
+        (["z", "uː"], ["z", "uː"]),
+        (["z", "uː"], ["s", "uː"]),
+        (["ð", "ə", "z", "iː", "b", "r", "ə"], ["d", "ə", "s", "ɪ", "b", "r", "ə", "z"]),
+        (["a", "b", "c"], []),
+        (["a"], ["x", "y", "z", "w"]),
+    ]
+    for e, p in pairs:
+        full = levenshtein_distance(e, p)
+        for max_cost in range(full + 2):
+            # Exact within the bound, clamped to max_cost + 1 beyond it.
+            assert levenshtein_distance(e, p, max_cost=max_cost) == min(full, max_cost + 1)
@@ -1,3 +1,6 @@
+import pytest
+
+from ipa_whisper_assessor import g2p
 from ipa_whisper_assessor.g2p import G2POptions, g2p_words
 
 
@@ -5,3 +8,42 @@ def test_g2p_cmudict_non_empty_for_common_word():
     out = g2p_words(["zoo"], G2POptions(backend="cmudict"))
     assert out[0] != ""
 
+
+def test_g2p_disk_cache_serves_repeat_words(monkeypatch, tmp_path):
+    pytest.importorskip("diskcache")
+    monkeypatch.delenv("IPA_ASSESS_NO_CACHE")
+    monkeypatch.setenv("IPA_ASSESS_CACHE_DIR", str(tmp_path))
+    g2p._g2p_cache.cache_clear()
+    calls = []
+
+    def fake_cmudict(words, lex):
+        calls.append(list(words))
+        return ["zuː" for _ in words]
+
+    monkeypatch.setattr(g2p, "_g2p_cmudict", fake_cmudict)
+    opts = G2POptions(backend="cmudict")
+    assert g2p_words(["zoo"], opts) == ["zuː"]
+    assert g2p_words(["zoo", "zoo"], opts) == ["zuː", "zuː"]
+    assert calls == [["zoo"]]
+    assert not g2p._g2p_cache().statistics
+
+
+def test_g2p_disk_cache_key_includes_backend_version(monkeypatch, tmp_path):
+    pytest.importorskip("diskcache")
+    monkeypatch.delenv("IPA_ASSESS_NO_CACHE")
+    monkeypatch.setenv("IPA_ASSESS_CACHE_DIR", str(tmp_path))
+    g2p._g2p_cache.cache_clear()
+    monkeypatch.setattr(g2p, "_g2p_cmudict", lambda words, lex: ["zuː" for _ in words])
+    opts = G2POptions(backend="cmudict")
+    g2p_words(["zoo"], opts)
+
+    # An upgraded backend must not be served the old entry.
+    monkeypatch.setattr(g2p, "_backend_version", lambda backend: "upgraded")
+    monkeypatch.setattr(g2p, "_g2p_cmudict", lambda words, lex: ["zu" for _ in words])
+    assert g2p_words(["zoo"], opts) == ["zu"]
+
+
+def test_g2p_cache_settings_does_not_create_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("IPA_ASSESS_CACHE_DIR", str(tmp_path / "cache"))
+    assert g2p._g2p_cache_settings() is None
+    assert not (tmp_path / "cache").exists()
@@ -1,14 +1,34 @@
-from ipa_whisper_assessor.ipa_tokenize import tokenize_ipa
+import sys
+
+from ipa_whisper_assessor.ipa_tokenize import split_reference_words, tokenize_ipa
 
 
 def test_tokenize_affricate_tie_bar():
-    assert tokenize_ipa("t͡ʃ") == ["t͡ʃ"]
+    assert tokenize_ipa("t͡ʃ") == ("t͡ʃ",)
 
 
 def test_tokenize_diphthong():
-    assert tokenize_ipa("aɪ") == ["aɪ"]
+    assert tokenize_ipa("aɪ") == ("aɪ",)
 
 
 def test_tokenize_stress_and_length():
-    assert tokenize_ipa("ˈziː") == ["ˈ", "z", "iː"]
+    assert tokenize_ipa("ˈziː") == ("ˈ", "z", "iː")
+
+
+def test_split_reference_words_keeps_apostrophes_and_hyphens():
+    assert split_reference_words("  It's a well-known café_2, isn’t it? ") == [
+        "It's",
+        "a",
+        "well-known",
+        "café",
+        "2",
+        "isn’t",
+        "it",
+    ]
+
 
+def test_tokens_are_interned():
+    a = tokenize_ipa("ziː")
+    b = tokenize_ipa("b ziː z")
+    assert a[0] is b[1] is b[3]
+    assert a[1] is sys.intern("iː")
@@ -0,0 +1,110 @@
+import html
+
+import pytest
+
+from ipa_whisper_assessor import report
+from ipa_whisper_assessor.schemas import (
+    AssessmentMetrics,
+    AssessmentResult,
+    MistakeEvent,
+    PhonemeOp,
+    TranscriptionResult,
+    WordAlignment,
+)
+
+
+def _result(mistakes, with_words=True):
+    result = AssessmentResult(
+        audio_path="a<b>.wav",
+        reference="The \"zoo\" & 'it'",
+        g2p_backend="cmudict",
+        model="m",
+        transcription=TranscriptionResult(audio_path="a<b>.wav", model="m", ipa_text="suː"),
+        word_alignments=[
+            WordAlignment(
+                word_index=0,
+                reference_word="zoo",
+                expected_ipa="zuː",
+                predicted_ipa="suːn",
+                start=0.0,
+                end=0.5,
+                phoneme_ops=[
+                    PhonemeOp(op="sub", expected="z", predicted="s"),
+                    PhonemeOp(op="match", expected="uː", predicted="uː"),
+                    PhonemeOp(op="ins", predicted="n"),
+                ],
+            ),
+            WordAlignment(
+                word_index=1,
+                reference_word="it",
+                expected_ipa="ɪt",
+                predicted_ipa="",
+                phoneme_ops=[PhonemeOp(op="del", expected="ɪ"), PhonemeOp(op="del", expected="t")],
+            ),
+        ],
+        metrics=AssessmentMetrics(phoneme_error_rate=0.75, substitutions=1, insertions=1, deletions=2),
+        mistakes=mistakes,
+    )
+    if not with_words:
+        result.word_alignments = []
+    return result
+
+
+@pytest.mark.parametrize(
+    "mistakes", [[], [MistakeEvent(rule="VOICING_ERROR_FRICATIVE", expected="z", predicted="s")]]
+)
+@pytest.mark.parametrize("with_words", [True, False])
+def test_write_html_template_matches_fallback(tmp_path, monkeypatch, mistakes, with_words):
+    pytest.importorskip("jinja2")
+    result = _result(mistakes, with_words)
+    report.write_html(result, tmp_path / "jinja.html")
+    monkeypatch.setattr(report, "_TEMPLATE", None)
+    report.write_html(result, tmp_path / "plain.html")
+
+    jinja_doc = (tmp_path / "jinja.html").read_text(encoding="utf-8")
+    plain_doc = (tmp_path / "plain.html").read_text(encoding="utf-8")
+    assert "<b>Audio:</b> a&lt;b&gt;.wav" in jinja_doc
+    assert jinja_doc == plain_doc
+    if with_words:
+        assert "<span class='sub'>z→s</span> <span class='ins'>+n</span>" in plain_doc
+    else:
+        assert "<tr><td colspan='5'>(none)</td></tr>" in plain_doc
+
+
+def test_write_json_orjson_matches_pydantic(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    result = _result([MistakeEvent(rule="VOICING_ERROR_FRICATIVE", expected="z", predicted="s")])
+    # Exponent-form floats are spelled differently by the two encoders unless normalized;
+    # look-alike text inside strings must be left alone.
+    result.metrics = AssessmentMetrics(
+        phoneme_error_rate=1e20, substitutions=1, insertions=1, deletions=2
+    )
+    result.reference = 'took 1e5 "2e3" tries'
+    result.substitution_histogram = {"3e4": 1}
+    report.write_json(result, tmp_path / "fast.json")
+    monkeypatch.setattr(report, "orjson", None)
+    report.write_json(result, tmp_path / "plain.json")
+    assert (tmp_path / "fast.json").read_bytes() == (tmp_path / "plain.json").read_bytes()
+
+
+def test_esc_matches_html_escape():
+    for s in ["ˈziːbrə", "a<b>&\"c'", "plain"]:
+        assert report._esc(s) == html.escape(s)
+    assert report._esc(None) == report._esc("") == ""
+
+
+def test_write_html_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(report, "_TEMPLATE", None)
+    report.write_html(_result([]), tmp_path / "full.html")
+    doc = (tmp_path / "full.html").read_text(encoding="utf-8")
+    assert "<b>Audio:</b> a&lt;b&gt;.wav" in doc
+    assert "<b>Reference:</b> The &quot;zoo&quot; &amp; &#x27;it&#x27;" in doc
+    assert "<td>0.00s–0.50s</td><td>zoo</td>" in doc
+    assert "<span class='sub'>z→s</span> <span class='ins'>+n</span>" in doc
+    assert "<span class='del'>-ɪ</span> <span class='del'>-t</span>" in doc
+    assert "<tr><td colspan='4'>(none)</td></tr>" in doc
+    assert doc.endswith("</html>\n")
+
+    report.write_html(_result([], with_words=False), tmp_path / "empty.html")
+    empty_doc = (tmp_path / "empty.html").read_text(encoding="utf-8")
+    assert "<tr><td colspan='5'>(none)</td></tr>" in empty_doc
@@ -0,0 +1,37 @@
+from ipa_whisper_assessor.edit_distance import EditOp
+from ipa_whisper_assessor.score import (
+    apply_default_mistake_rules,
+    substitution_histogram,
+    summarize,
+)
+
+
+def test_mistake_rules_and_histogram():
+    ops = [
+        EditOp("sub", "z", "s"),
+        EditOp("sub", "z", "s"),
+        EditOp("sub", "ð", "d"),
+        EditOp("sub", "k", "g"),
+        EditOp("match", "u", "u"),
+        EditOp("del", "z", None),
+        EditOp("ins", None, "s"),
+    ]
+    assert sorted(apply_default_mistake_rules(ops)) == [
+        ("TH_FRONTING_OR_STOPPING", "ð", "d", 1),
+        ("VOICING_ERROR_FRICATIVE", "z", "s", 2),
+    ]
+    assert substitution_histogram(ops) == {"z→s": 2, "ð→d": 1, "k→g": 1}
+
+
+def test_summarize_matches_wrappers():
+    ops = [
+        EditOp("sub", "ɪ", "i"),
+        EditOp("match", "t", "t"),
+        EditOp("del", "z", None),
+        EditOp("ins", None, "s"),
+        EditOp("ins", None, "ə"),
+    ]
+    hist, mistakes, subs, ins, dels = summarize(ops)
+    assert hist == substitution_histogram(ops) == {"ɪ→i": 1}
+    assert mistakes == apply_default_mistake_rules(ops) == [("VOWEL_TENSE_LAX", "ɪ", "i", 1)]
+    assert (subs, ins, dels) == (1, 2, 1)
@@ -0,0 +1,97 @@
+import sys
+import types
+
+from ipa_whisper_assessor import transcribe
+
+
+def test_pipeline_cache_is_keyed_by_options(monkeypatch):
+    built = []
+
+    def fake_build(model_id, device, chunk_length_s):
+        built.append((model_id, device, chunk_length_s))
+        return object()
+
+    monkeypatch.setattr(transcribe, "_build_pipeline", fake_build)
+    monkeypatch.setattr(transcribe, "_PIPELINES", {})
+
+    a = transcribe._get_pipeline("m1", "cpu", 30)
+    assert transcribe._get_pipeline("m1", "cpu", 30) is a
+    b = transcribe._get_pipeline("m2", "cpu", 30)
+    assert b is not a
+    assert built == [("m1", "cpu", 30), ("m2", "cpu", 30)]
+
+
+def test_resolve_dtype():
+    class FakeTorch:
+        float16 = "f16"
+        bfloat16 = "bf16"
+        float32 = "f32"
+
+    assert transcribe._resolve_dtype(FakeTorch, 0) == "f16"
+    assert transcribe._resolve_dtype(FakeTorch, "mps") == "f16"
+    assert transcribe._resolve_dtype(FakeTorch, -1) == "f32"
+
+
+def test_transcribe_batch_uses_one_pipeline_call(monkeypatch):
+    # Stand-in for the audio module so the test doesn't need numpy; the fake pipe ignores samples.
+    fake_audio = types.ModuleType("ipa_whisper_assessor.audio")
+    fake_audio.load_audio_16k_mono = lambda path: (object(), 16000)
+    monkeypatch.setitem(sys.modules, "ipa_whisper_assessor.audio", fake_audio)
+    calls = []
+
+    def fake_pipe(inputs, **kwargs):
+        calls.append((len(inputs), kwargs))
+        chunks = [{"text": " a", "timestamp": (0.0, 0.5)}]
+        return [{"text": f"a{i}", "chunks": chunks} for i in range(len(inputs))]
+
+    opts = transcribe.TranscribeOptions(timestamps="word")
+    results = transcribe.transcribe_batch(["x.wav", "y.wav"], opts, batch_size=2, pipe=fake_pipe)
+    assert calls == [(2, {"batch_size": 2, "return_timestamps": "word"})]
+    assert [r.audio_path for r in results] == ["x.wav", "y.wav"]
+    assert [r.ipa_text for r in results] == ["a0", "a1"]
+    assert results[0].ipa_words[0].start == 0.0
+
+
+def test_out_to_result_builds_valid_models():
+    from ipa_whisper_assessor.schemas import TranscriptionResult
+
+    out = {
+        "text": " ðə  zuː ",
+        "chunks": [
+            {"text": " ðə", "timestamp": (0.0, 0.2)},
+            {"text": "zuː", "timestamp": (0.2, None)},
+            {"text": "x"},
+        ],
+    }
+    result = transcribe._out_to_result("a.wav", out, transcribe.TranscribeOptions())
+    # The fast path skips validation; a full validation pass must accept it unchanged.
+    assert TranscriptionResult.model_validate(result.model_dump()) == result
+    assert result.ipa_text == "ðə zuː"
+    assert [(w.start, w.end) for w in result.ipa_words] == [(0.0, 0.2), (0.2, None), (None, None)]
+
+
+def test_shared_pipeline_runs_one_inference_at_a_time(monkeypatch):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    fake_audio = types.ModuleType("ipa_whisper_assessor.audio")
+    fake_audio.load_audio_16k_mono = lambda path: (object(), 16000)
+    monkeypatch.setitem(sys.modules, "ipa_whisper_assessor.audio", fake_audio)
+    active = []
+    overlapped = threading.Event()
+    guard = threading.Lock()
+
+    def fake_pipe(inputs, **kwargs):
+        with guard:
+            active.append(1)
+            if len(active) > 1:
+                overlapped.set()
+        threading.Event().wait(0.01)
+        with guard:
+            active.pop()
+        return {"text": "a"}
+
+    opts = transcribe.TranscribeOptions()
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(lambda p: transcribe.transcribe_audio(p, opts, pipe=fake_pipe), ["x"] * 8))
+    assert not overlapped.is_set()